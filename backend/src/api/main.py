@@ -0,0 +1,111 @@
+"""
+FastAPI service exposing the portfolio risk pipeline.
+
+Heavy objects (data fetcher, trained classifier, LLM agent) are built once in
+the lifespan hook and shared across requests via app.state - the fetcher in
+particular reuses its HTTP connection pools, avoiding a TCP/TLS handshake per
+request.
+"""
+import os
+import logging
+from contextlib import asynccontextmanager
+from typing import Dict, List
+
+import numpy as np
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+
+from src.data.etf_ingestion import ETFDataFetcher
+from src.features.portfolio_builder import PortfolioBuilder
+from src.features.risk_metrics import RiskFeatureEngineer
+from src.features.dataset_builder import DatasetBuilder
+from src.features._numba_kernels import warm_up
+from src.llm.mock_agent import MockLLMAgent
+import train_model
+
+logger = logging.getLogger(__name__)
+
+# ~180 calendar days comfortably covers one 126-trading-day inference window
+INFERENCE_LOOKBACK_DAYS = 180
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pre-warm the numba kernels so the first request never sees JIT latency
+    warm_up()
+
+    # Singletons shared across all requests
+    app.state.fetcher = ETFDataFetcher(lookback_days=INFERENCE_LOOKBACK_DAYS, cache_dir=train_model.CACHE_DIR)
+    app.state.llm_agent = MockLLMAgent()
+
+    logger.info("Training risk classifier at startup...")
+    app.state.classifier, _ = train_model.main()
+
+    yield
+
+app = FastAPI(title="QuantShield Risk API", lifespan=lifespan)
+
+class Holding(BaseModel):
+    ticker: str
+    weight: float
+
+class PortfolioRequest(BaseModel):
+    etf_name: str
+    holdings: List[Holding]
+
+class RiskResponse(BaseModel):
+    etf_name: str
+    risk_class: str
+    features: Dict[str, float]
+    explanation: str
+
+def _assess_portfolio(app: FastAPI, request: PortfolioRequest) -> RiskResponse:
+    """Runs the fetch -> reconstruct -> feature -> classify pipeline for one portfolio."""
+    fetched = app.state.fetcher.fetch_data({
+        "etf_name": request.etf_name,
+        "holdings": [{"ticker": h.ticker, "weight": h.weight} for h in request.holdings]
+    })
+
+    builder = PortfolioBuilder(fetched["price_data"])
+    portfolio_df = builder.build_portfolio(fetched["weights"])
+
+    window_length = DatasetBuilder.WINDOW_LENGTH
+    if len(portfolio_df) < window_length:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Not enough history for a {window_length}-day risk window. Got {len(portfolio_df)} days."
+        )
+
+    window_returns = portfolio_df["Daily_Return"].iloc[-window_length:]
+    component_returns = builder.daily_returns.iloc[-window_length:]
+
+    engineer = RiskFeatureEngineer(window_returns, component_returns, fetched["weights"])
+    features = engineer.compute_all_features()
+
+    feature_row = np.array([
+        features["Annualized_Volatility"],
+        features["Historical_VaR_95"],
+        features["Maximum_Drawdown"],
+        features.get("Diversification_Ratio", 1.0)
+    ], dtype=np.float64)
+    risk_class = str(app.state.classifier.predict(feature_row)[0])
+
+    explanation = app.state.llm_agent.generate_explanation(risk_class, features)
+
+    return RiskResponse(
+        etf_name=request.etf_name,
+        risk_class=risk_class,
+        features={k: float(v) for k, v in features.items()},
+        explanation=explanation
+    )
+
+@app.post("/api/v1/risk/predict", response_model=RiskResponse)
+def predict_risk(request: PortfolioRequest) -> RiskResponse:
+    # Deliberately sync: the pipeline blocks on yfinance HTTP, pandas and
+    # sklearn, so FastAPI must run it on its threadpool instead of the event
+    # loop, where it would serialize all concurrent requests
+    try:
+        return _assess_portfolio(app, request)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
@@ -1,9 +1,14 @@
 import yfinance as yf
+import numpy as np
 import pandas as pd
-from datetime import datetime
+import pyarrow.parquet as pq
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
+from pathlib import Path
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -14,14 +19,144 @@ class ETFDataFetcher:
     Follows a Holdings-Based Portfolio Reconstruction approach.
     """
     
-    def __init__(self, years: int = 5):
+    # Cached price files older than this are considered stale and re-downloaded
+    CACHE_MAX_AGE_SECONDS = 24 * 60 * 60
+
+    # Cap on concurrent yfinance requests
+    MAX_FETCH_WORKERS = 8
+
+    # Per-request timeout so one slow ticker cannot block the whole pool
+    FETCH_TIMEOUT_SECONDS = 10
+
+    def __init__(self, years: int = 5, cache_dir: str = None, lookback_days: int = None):
+        """
+        Args:
+            years (int): Number of years of history to fetch.
+            cache_dir (str): Optional directory for an on-disk per-ticker price cache.
+                             When set, previously fetched tickers are read from parquet
+                             instead of re-downloading from yfinance.
+            lookback_days (int): Optional calendar-day lookback that overrides `years`.
+                                 Inference only needs ~180 days for a 126-trading-day
+                                 window, so this avoids downloading the full history
+                                 per request.
+        """
         self.years = years
-        
+        self.lookback_days = lookback_days
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+    def _cache_path(self, ticker: str) -> Path:
+        return self.cache_dir / f"{ticker.replace('/', '_')}.parquet"
+
+    def _load_cached_prices(self, tickers: List[str], start_date: pd.Timestamp) -> Tuple[Optional[pd.DataFrame], List[str]]:
+        """
+        Loads cached price columns that are fresh and cover the requested start date.
+        Returns the cached DataFrame (or None) and the tickers still to download.
+        """
+        cached_columns = {}
+        tickers_to_download = []
+
+        for ticker in tickers:
+            path = self._cache_path(ticker)
+            try:
+                if not path.exists() or (time.time() - path.stat().st_mtime) > self.CACHE_MAX_AGE_SECONDS:
+                    tickers_to_download.append(ticker)
+                    continue
+                # Memory-map the parquet file so repeated loads share page cache
+                # instead of copying the whole column into fresh RAM each call
+                table = pq.read_table(path, memory_map=True)
+                cached = table.to_pandas(split_blocks=True, self_destruct=True)
+                # Allow a few calendar days of slack for the first trading day
+                if cached.empty or cached.index[0] > start_date + pd.Timedelta(days=7):
+                    tickers_to_download.append(ticker)
+                    continue
+                cached_columns[ticker] = cached[ticker]
+            except Exception as e:
+                logger.warning(f"Could not read price cache for {ticker}: {e}")
+                tickers_to_download.append(ticker)
+
+        if not cached_columns:
+            return None, tickers_to_download
+
+        cached_df = pd.concat(cached_columns, axis=1).loc[start_date:]
+        return cached_df, tickers_to_download
+
+    def _fetch_one(self, ticker: str, start_date: datetime, end_date: datetime) -> Optional[pd.Series]:
+        """
+        Downloads a single ticker and extracts its adjusted close series.
+        Returns None (with a warning) on failure so the pool can keep going.
+        """
+        try:
+            data = yf.download(ticker, start=start_date, end=end_date, progress=False,
+                               timeout=self.FETCH_TIMEOUT_SECONDS)
+        except Exception as e:
+            logger.warning(f"Download failed for {ticker}: {e}")
+            return None
+
+        if data is None or data.empty:
+            logger.warning(f"Download returned no rows for {ticker}.")
+            return None
+
+        if isinstance(data.columns, pd.MultiIndex):
+            # yfinance >= 0.2.x returns MultiIndex
+            price_level = data.columns.get_level_values(0).unique()
+            if 'Adj Close' in price_level:
+                prices = data.xs('Adj Close', axis=1, level=0)
+            elif 'Close' in price_level:
+                prices = data.xs('Close', axis=1, level=0)
+                logger.warning(f"Falling back to 'Close' for {ticker}. 'Adj Close' not found.")
+            else:
+                logger.warning(f"Neither 'Adj Close' nor 'Close' found for {ticker}.")
+                return None
+            series = prices[ticker] if ticker in prices.columns else prices.iloc[:, 0]
+        else:
+            if 'Adj Close' in data.columns:
+                series = data['Adj Close']
+            elif 'Close' in data.columns:
+                series = data['Close']
+                logger.warning(f"Falling back to 'Close' for {ticker}. 'Adj Close' not found.")
+            else:
+                logger.warning(f"Neither 'Adj Close' nor 'Close' found for {ticker}.")
+                return None
+
+        return series.rename(ticker)
+
+    def _download_prices(self, tickers: List[str], start_date: datetime, end_date: datetime) -> Optional[pd.DataFrame]:
+        """
+        Fans out one download per ticker across a thread pool and joins the
+        resulting adjusted close series on the date index.
+        """
+        series_by_ticker = {}
+        max_workers = min(self.MAX_FETCH_WORKERS, len(tickers))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._fetch_one, ticker, start_date, end_date): ticker
+                for ticker in tickers
+            }
+            for future in as_completed(futures):
+                series = future.result()
+                if series is not None:
+                    series_by_ticker[series.name] = series
+
+        if not series_by_ticker:
+            return None
+
+        return pd.concat(series_by_ticker, axis=1, sort=True)
+
+    def _store_cached_prices(self, df: pd.DataFrame):
+        """Writes each downloaded ticker column to its own parquet cache file."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for ticker in df.columns:
+            try:
+                df[[ticker]].to_parquet(self._cache_path(ticker))
+            except Exception as e:
+                logger.warning(f"Could not write price cache for {ticker}: {e}")
+
     def fetch_data(self, holdings_input: Dict[str, Any]) -> Dict[str, Any]:
         """
         Accepts ETF holdings structure, extracts underlying tickers,
         and fetches 'Adj Close' prices for the last `self.years` years.
-        
+
         Args:
             holdings_input (Dict): Expected format:
             {
@@ -32,37 +167,60 @@ class ETFDataFetcher:
                     ...
                 ]
             }
-            
+            Alternatively, holdings can be passed as parallel arrays:
+            {
+                "etf_name": "...",
+                "tickers": ["...", ...],
+                "weights": [..., ...]
+            }
+
         Returns:
             Dict: Output format:
             {
                 "etf_name": str,
                 "weights": Dict[str, float],
+                "tickers": List[str],
+                "weight_array": np.ndarray (aligned to price_data columns),
                 "price_data": pd.DataFrame
             }
         """
-        if "etf_name" not in holdings_input or "holdings" not in holdings_input:
-            raise ValueError("Input must contain 'etf_name' and 'holdings' keys.")
-            
+        has_holdings_list = "holdings" in holdings_input
+        has_parallel_arrays = "tickers" in holdings_input and "weights" in holdings_input
+        if "etf_name" not in holdings_input or not (has_holdings_list or has_parallel_arrays):
+            raise ValueError("Input must contain 'etf_name' and 'holdings' (or parallel 'tickers'/'weights') keys.")
+
         etf_name = holdings_input["etf_name"]
-        holdings_list = holdings_input["holdings"]
-        
-        if not holdings_list:
-            raise ValueError("The 'holdings' list cannot be empty.")
-            
-        # Extract weights and list of tickers to fetch
-        weights = {}
-        tickers_to_fetch = []
-        
-        for item in holdings_list:
-            if "ticker" not in item or "weight" not in item:
-                raise ValueError("Each holding must contain a 'ticker' and 'weight'.")
-            ticker = item["ticker"]
-            weight = float(item["weight"])
-            
-            weights[ticker] = weight
-            tickers_to_fetch.append(ticker)
-            
+
+        if has_holdings_list:
+            holdings_list = holdings_input["holdings"]
+
+            if not holdings_list:
+                raise ValueError("The 'holdings' list cannot be empty.")
+
+            # Extract weights and list of tickers to fetch
+            weights = {}
+            tickers_to_fetch = []
+
+            for item in holdings_list:
+                if "ticker" not in item or "weight" not in item:
+                    raise ValueError("Each holding must contain a 'ticker' and 'weight'.")
+                ticker = item["ticker"]
+                weight = float(item["weight"])
+
+                weights[ticker] = weight
+                tickers_to_fetch.append(ticker)
+        else:
+            # Structure-of-arrays input: parallel ticker and weight sequences
+            tickers_to_fetch = list(holdings_input["tickers"])
+            weight_values = [float(w) for w in holdings_input["weights"]]
+
+            if not tickers_to_fetch:
+                raise ValueError("The 'tickers' list cannot be empty.")
+            if len(tickers_to_fetch) != len(weight_values):
+                raise ValueError("'tickers' and 'weights' must have the same length.")
+
+            weights = dict(zip(tickers_to_fetch, weight_values))
+
         # Verify weights approximately sum to 1.0 (or 100 if percentages, assuming normalized to 1)
         total_weight = sum(weights.values())
         if not (0.95 <= total_weight <= 1.05):
@@ -70,44 +228,46 @@ class ETFDataFetcher:
 
         # Fetch Data
         end_date = datetime.today()
-        start_date = end_date - relativedelta(years=self.years)
-        
-        logger.info(f"Fetching data for {len(tickers_to_fetch)} underlying stocks from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
+        if self.lookback_days is not None:
+            start_date = end_date - timedelta(days=self.lookback_days)
+        else:
+            start_date = end_date - relativedelta(years=self.years)
         
+        # Serve whatever the on-disk cache already holds; only download the deficit
+        cached_df = None
+        tickers_to_download = tickers_to_fetch
+        if self.cache_dir is not None:
+            cached_df, tickers_to_download = self._load_cached_prices(tickers_to_fetch, pd.Timestamp(start_date))
+            if cached_df is not None:
+                logger.info(f"Loaded {cached_df.shape[1]} tickers from price cache. {len(tickers_to_download)} left to download.")
+
+        logger.info(f"Fetching data for {len(tickers_to_download)} underlying stocks from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
+
         try:
-            # yfinance returns a MultiIndex DataFrame if multiple tickers are provided
-            data = yf.download(tickers_to_fetch, start=start_date, end=end_date, progress=False)
-            
-            # Error checking: yfinance might download empty data if no tickers are valid
-            if data.empty:
-                raise ValueError("Downloaded data is completely empty. Please verify tickers.")
-            
-            # Extract 'Adj Close'
-            if isinstance(data.columns, pd.MultiIndex):
-                # yfinance >= 0.2.x returns MultiIndex
-                price_level = data.columns.get_level_values(0).unique()
-                if 'Adj Close' in price_level:
-                    df = data.xs('Adj Close', axis=1, level=0)
-                elif 'Close' in price_level:
-                    df = data.xs('Close', axis=1, level=0)
-                    logger.warning("Falling back to 'Close'. 'Adj Close' not found.")
-                else:
-                    raise ValueError("Neither 'Adj Close' nor 'Close' found in downloaded data.")
-            else:
-                # Fallback for single ticker
-                if 'Adj Close' in data.columns:
-                    df = data['Adj Close'].to_frame(name=tickers_to_fetch[0])
-                elif 'Close' in data.columns:
-                    df = data['Close'].to_frame(name=tickers_to_fetch[0])
-                    logger.warning("Falling back to 'Close'. 'Adj Close' not found.")
-                else:
-                    raise ValueError("Neither 'Adj Close' nor 'Close' found in downloaded data.")
-            
+            df = None
+            if tickers_to_download:
+                # One download per ticker, fanned out across the thread pool
+                df = self._download_prices(tickers_to_download, start_date, end_date)
+
+                # Error checking: yfinance might download empty data if no tickers are valid
+                if df is None and cached_df is None:
+                    raise ValueError("Downloaded data is completely empty. Please verify tickers.")
+
+                if df is not None and self.cache_dir is not None:
+                    self._store_cached_prices(df)
+
+            # Merge freshly downloaded columns with the cached ones
+            if cached_df is not None:
+                df = pd.concat([cached_df, df], axis=1, sort=True) if df is not None else cached_df
+
             # Validate all requested tickers returned columns
             missing_tickers = [t for t in tickers_to_fetch if t not in df.columns]
             if missing_tickers:
                  raise ValueError(f"Failed to fetch data for these expected tickers: {missing_tickers}")
 
+            # Keep columns in holdings order regardless of cache/download split
+            df = df[tickers_to_fetch]
+
             # Data Integrity: Forward fill holidays/weekends, backward fill missing starting prices
             df = df.ffill().bfill()
             
@@ -121,6 +281,8 @@ class ETFDataFetcher:
             result = {
                 "etf_name": etf_name,
                 "weights": weights,
+                "tickers": tickers_to_fetch,
+                "weight_array": np.array([weights[t] for t in df.columns], dtype=np.float64),
                 "price_data": df
             }
             
@@ -0,0 +1,201 @@
+"""
+Numba-compiled kernels for the hot rolling risk-metric computations.
+
+These kernels operate on raw float64 return arrays so the panel builder can
+score thousands of windows without re-entering pandas per window.
+"""
+import numpy as np
+from numba import guvectorize, njit, prange, types
+
+TRADING_DAYS_PER_YEAR = 252
+
+# Window length the panel builder uses; baked into the specialized kernel
+# below as a compile-time constant
+PANEL_WINDOW_LENGTH = 126
+
+# Input arrays are declared readonly so zero-copy (immutable) pandas views
+# bind without a defensive copy
+_readonly_f8 = types.Array(types.float64, 1, "C", readonly=True)
+_readonly_i8 = types.Array(types.int64, 1, "C", readonly=True)
+
+@njit(inline="always")
+def _window_var95_mdd(window, length):
+    """Per-window 95% VaR (order statistic) and max drawdown."""
+    # VaR as the ceil(0.05*length)-th worst return, clamped at zero for
+    # all-gain windows - the same definition as
+    # RiskFeatureEngineer.compute_historical_var_95, so the training panel
+    # and the serving path produce identical features. np.partition places
+    # the order statistic in O(n) without a full sort.
+    k = int(np.ceil(0.05 * length)) - 1
+    if k < 0:
+        k = 0
+    var95 = -np.partition(window, k)[k]
+    if var95 < 0.0:
+        var95 = 0.0
+
+    # Max drawdown in one pass with scalar running product / peak
+    cumulative = 1.0
+    peak = 1.0
+    max_dd = 0.0
+    for j in range(length):
+        cumulative *= 1.0 + window[j]
+        if cumulative > peak:
+            peak = cumulative
+        drawdown = (peak - cumulative) / peak
+        if drawdown > max_dd:
+            max_dd = drawdown
+
+    return var95, max_dd
+
+@njit(inline="always")
+def _prefix_sums(returns):
+    """Running sum and sum of squares shared by all overlapping windows."""
+    n = returns.shape[0]
+    cumsum = np.empty(n + 1, dtype=np.float64)
+    cumsum2 = np.empty(n + 1, dtype=np.float64)
+    cumsum[0] = 0.0
+    cumsum2[0] = 0.0
+    for j in range(n):
+        x = returns[j]
+        cumsum[j + 1] = cumsum[j] + x
+        cumsum2[j + 1] = cumsum2[j] + x * x
+    return cumsum, cumsum2
+
+@njit(inline="always")
+def _window_vol(cumsum, cumsum2, start, end, length, sqrt_annual):
+    """Annualized volatility (sample std, ddof=1) from the prefix sums."""
+    mean = (cumsum[end] - cumsum[start]) / length
+    variance = (cumsum2[end] - cumsum2[start] - length * mean * mean) / (length - 1)
+    if variance < 0.0:  # guard against cancellation on near-constant windows
+        variance = 0.0
+    return np.sqrt(variance) * sqrt_annual
+
+# The explicit signatures force compilation at import (cached to disk via
+# cache=True), so the first real request never pays the JIT latency.
+@njit(types.void(_readonly_f8, _readonly_i8, types.int64,
+                 types.float64[::1], types.float64[::1], types.float64[::1]),
+      parallel=True, fastmath=True, cache=True, nogil=True)
+def compute_window_stats(returns, starts, length, out_vol, out_var, out_mdd):
+    """
+    Fills annualized volatility, 95% VaR and max drawdown for every rolling
+    window `returns[starts[i]:starts[i] + length]` in parallel.
+    """
+    sqrt_annual = np.sqrt(float(TRADING_DAYS_PER_YEAR))
+    cumsum, cumsum2 = _prefix_sums(returns)
+
+    for i in prange(starts.shape[0]):
+        start = starts[i]
+        end = start + length
+        window = returns[start:end]
+
+        out_vol[i] = _window_vol(cumsum, cumsum2, start, end, length, sqrt_annual)
+        out_var[i], out_mdd[i] = _window_var95_mdd(window, length)
+
+@njit(types.void(_readonly_f8, _readonly_i8,
+                 types.float64[::1], types.float64[::1], types.float64[::1]),
+      parallel=True, fastmath=True, cache=True, nogil=True)
+def compute_window_stats_len126(returns, starts, out_vol, out_var, out_mdd):
+    """
+    Specialization of `compute_window_stats` with the 126-day panel window
+    baked in as a compile-time constant, letting LLVM unroll and vectorize
+    the fixed-trip-count inner loops.
+    """
+    length = PANEL_WINDOW_LENGTH
+    sqrt_annual = np.sqrt(float(TRADING_DAYS_PER_YEAR))
+    cumsum, cumsum2 = _prefix_sums(returns)
+
+    for i in prange(starts.shape[0]):
+        start = starts[i]
+        end = start + length
+        window = returns[start:end]
+
+        out_vol[i] = _window_vol(cumsum, cumsum2, start, end, length, sqrt_annual)
+        out_var[i], out_mdd[i] = _window_var95_mdd(window, length)
+
+@njit(types.float64(_readonly_f8), fastmath=True, cache=True, nogil=True)
+def max_drawdown(returns):
+    """
+    Single-pass max drawdown over a 1-D return array, accumulated in log space:
+    a running product of (1 + r) can underflow/overflow and drift on long
+    horizons, whereas sum(log1p(r)) stays stable and expm1 recovers the
+    drawdown with full precision near zero.
+    """
+    log_cum = 0.0
+    log_peak = 0.0
+    max_dd = 0.0
+    for i in range(returns.shape[0]):
+        log_cum += np.log1p(returns[i])
+        if log_cum > log_peak:
+            log_peak = log_cum
+        drawdown = -np.expm1(log_cum - log_peak)
+        if drawdown > max_dd:
+            max_dd = drawdown
+    return max_dd
+
+@guvectorize([(types.float64[:], types.float64[:])], '(n)->()',
+             nopython=True, cache=True)
+def max_drawdown_gu(returns, out):
+    """
+    Gufunc form of `max_drawdown`: broadcasts over the leading axes, so one
+    call on an (n_assets, n_days) matrix yields per-asset drawdowns without a
+    Python loop. Same log-space accumulation as the scalar kernel.
+    """
+    log_cum = 0.0
+    log_peak = 0.0
+    max_dd = 0.0
+    for i in range(returns.shape[0]):
+        log_cum += np.log1p(returns[i])
+        if log_cum > log_peak:
+            log_peak = log_cum
+        drawdown = -np.expm1(log_cum - log_peak)
+        if drawdown > max_dd:
+            max_dd = drawdown
+    out[0] = max_dd
+
+@njit(types.UniTuple(types.float64, 2)(_readonly_f8), fastmath=True, cache=True, nogil=True)
+def return_stats(returns):
+    """
+    Fused single pass over a 1-D return array producing the daily sample std
+    (ddof=1) and the max drawdown: same FLOPs as computing them separately,
+    but one trip through memory instead of several.
+    """
+    n = returns.shape[0]
+    sum_ = 0.0
+    sq_sum = 0.0
+    log_cum = 0.0
+    log_peak = 0.0
+    max_dd = 0.0
+    for i in range(n):
+        x = returns[i]
+        sum_ += x
+        sq_sum += x * x
+        # Drawdown tracked in log space (see max_drawdown) for numerical stability
+        log_cum += np.log1p(x)
+        if log_cum > log_peak:
+            log_peak = log_cum
+        drawdown = -np.expm1(log_cum - log_peak)
+        if drawdown > max_dd:
+            max_dd = drawdown
+
+    mean = sum_ / n
+    variance = (sq_sum - n * mean * mean) / (n - 1)
+    if variance < 0.0:  # guard against cancellation on near-constant windows
+        variance = 0.0
+    return np.sqrt(variance), max_dd
+
+def warm_up(window_length: int = PANEL_WINDOW_LENGTH):
+    """
+    Runs every kernel once on dummy data. Eager signatures already compile at
+    import; this additionally exercises the compiled paths (and the on-disk
+    cache load) so a serving process can pay any remaining cost at startup
+    rather than on its first request.
+    """
+    dummy = np.zeros(window_length + 1, dtype=np.float64)
+    starts = np.zeros(1, dtype=np.int64)
+    out = np.empty(1, dtype=np.float64)
+    compute_window_stats(dummy, starts, window_length, out, out.copy(), out.copy())
+    if window_length == PANEL_WINDOW_LENGTH:
+        compute_window_stats_len126(dummy, starts, out, out.copy(), out.copy())
+    max_drawdown(dummy)
+    max_drawdown_gu(dummy)
+    return_stats(dummy)
@@ -3,6 +3,7 @@ import numpy as np
 import logging
 from typing import Dict, List, Tuple
 from src.features.risk_metrics import RiskFeatureEngineer
+from src.features._numba_kernels import PANEL_WINDOW_LENGTH, compute_window_stats, compute_window_stats_len126
 
 logger = logging.getLogger(__name__)
 
@@ -47,74 +48,123 @@ class DatasetBuilder:
         else:
             return "Medium"
 
+    def _assign_risk_labels(self, vol: np.ndarray, var95: np.ndarray, max_dd: np.ndarray) -> np.ndarray:
+        """
+        Vectorized counterpart of `_assign_risk_label` applied to arrays of window metrics.
+        Must stay in sync with the scalar thresholds above.
+        """
+        conditions = [
+            (vol < 0.12) & (max_dd < 0.15),
+            (vol > 0.20) | (max_dd > 0.25) | (var95 > 0.03)
+        ]
+        return np.select(conditions, ["Low", "High"], default="Medium")
+
+    def _compute_window_metrics(self, returns: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Computes annualized volatility, 95% VaR and maximum drawdown for every rolling
+        window via a parallel Numba kernel over the raw return array.
+        """
+        starts = np.arange(0, returns.shape[0] - self.WINDOW_LENGTH + 1, self.STEP_SIZE, dtype=np.int64)
+
+        vol = np.empty(starts.size, dtype=np.float64)
+        var95 = np.empty(starts.size, dtype=np.float64)
+        max_dd = np.empty(starts.size, dtype=np.float64)
+        if self.WINDOW_LENGTH == PANEL_WINDOW_LENGTH:
+            # Fixed-length specialization with the 126-day window baked in
+            compute_window_stats_len126(returns, starts, vol, var95, max_dd)
+        else:
+            compute_window_stats(returns, starts, self.WINDOW_LENGTH, vol, var95, max_dd)
+
+        return vol, var95, max_dd
+
     def build_panel_dataset(self) -> pd.DataFrame:
         """
         Applies rolling windows to each reconstructed portfolio and computes exactly 4 approved features.
-        
+
         Returns:
             pd.DataFrame: Panel Dataset structured as:
                           Portfolio_ID | Window_Start | Window_End | Vol | VaR95 | MaxDD | DivRatio | Label
         """
-        rows = []
-        
+        frames = []
+
         for portfolio_id, portfolio_df in self.portfolios.items():
             if 'Daily_Return' not in portfolio_df.columns:
                 logger.warning(f"Portfolio {portfolio_id} is missing 'Daily_Return' column. Skipping.")
                 continue
-                
+
             daily_returns = portfolio_df['Daily_Return'].dropna()
             n_days = len(daily_returns)
-            
+
             if n_days < self.WINDOW_LENGTH:
                 logger.warning(f"Not enough data for {portfolio_id}. Required: {self.WINDOW_LENGTH}, Available: {n_days}. Skipping.")
                 continue
-                
+
             component_returns = self.component_returns_dict.get(portfolio_id)
             weights = self.weights_dict.get(portfolio_id)
-                
-            # Apply rolling windows
-            for start_idx in range(0, n_days - self.WINDOW_LENGTH + 1, self.STEP_SIZE):
-                end_idx = start_idx + self.WINDOW_LENGTH
-                window_returns = daily_returns.iloc[start_idx:end_idx]
-                
-                window_start = window_returns.index[0]
-                window_end = window_returns.index[-1]
-                
-                # Slice component returns if available
-                window_component_returns = None
-                if component_returns is not None:
-                     # Attempt to slice component returns to match the window
-                     try:
-                         # Ensure alignment by index limits
-                         window_component_returns = component_returns.loc[window_start:window_end]
-                     except Exception as e:
-                         logger.warning(f"Could not slice component returns for {portfolio_id}: {e}")
-                
-                engineer = RiskFeatureEngineer(
-                    portfolio_returns=window_returns,
-                    component_returns=window_component_returns,
-                    weights=weights
-                )
-                
-                features = engineer.compute_all_features()
-                
-                vol = features.get("Annualized_Volatility", np.nan)
-                var95 = features.get("Historical_VaR_95", np.nan)
-                max_dd = features.get("Maximum_Drawdown", np.nan)
-                div_ratio = features.get("Diversification_Ratio", 1.0) # Default to 1.0 if untrackable
-                
-                label = self._assign_risk_label(vol, var95, max_dd)
-                
-                rows.append({
-                    "Portfolio_ID": portfolio_id,
-                    "Window_Start": window_start,
-                    "Window_End": window_end,
-                    "Vol": vol,
-                    "VaR95": var95,
-                    "MaxDD": max_dd,
-                    "DivRatio": div_ratio,
-                    "Label": label
-                })
-                
-        panel_df = pd.DataFrame(rows)
+
+            # All three scalar metrics are computed column-wise over a strided window
+            # matrix instead of instantiating a RiskFeatureEngineer per window
+            returns = daily_returns.to_numpy(dtype=np.float64)
+            vol, var95, max_dd = self._compute_window_metrics(returns)
+
+            starts = np.arange(0, n_days - self.WINDOW_LENGTH + 1, self.STEP_SIZE)
+            window_starts = daily_returns.index[starts]
+            window_ends = daily_returns.index[starts + self.WINDOW_LENGTH - 1]
+
+            # Diversification Ratio still needs per-window component returns, so it
+            # falls back to the engineer only when components are available
+            div_ratio = np.ones(len(starts), dtype=np.float64)
+            if component_returns is not None and weights is not None:
+                # When the component index matches the portfolio index, roll the
+                # component covariance forward between overlapping windows instead
+                # of recomputing it from scratch each step
+                aligned = component_returns.index.equals(daily_returns.index)
+                if aligned:
+                    components = component_returns.to_numpy(dtype=np.float64)
+                    first_window = components[starts[0]:starts[0] + self.WINDOW_LENGTH]
+                    col_sums = first_window.sum(axis=0)
+                    cross_products = first_window.T @ first_window
+
+                for i, (window_start, window_end) in enumerate(zip(window_starts, window_ends)):
+                    if aligned:
+                        if i > 0:
+                            leaving = components[starts[i - 1]:starts[i]]
+                            entering = components[starts[i - 1] + self.WINDOW_LENGTH:starts[i] + self.WINDOW_LENGTH]
+                            col_sums += entering.sum(axis=0) - leaving.sum(axis=0)
+                            cross_products += entering.T @ entering - leaving.T @ leaving
+                        col_means = col_sums / self.WINDOW_LENGTH
+                        window_cov = (cross_products - self.WINDOW_LENGTH * np.outer(col_means, col_means)) / (self.WINDOW_LENGTH - 1)
+                        window_component_returns = component_returns.iloc[starts[i]:starts[i] + self.WINDOW_LENGTH]
+                    else:
+                        window_cov = None
+                        try:
+                            window_component_returns = component_returns.loc[window_start:window_end]
+                        except Exception as e:
+                            logger.warning(f"Could not slice component returns for {portfolio_id}: {e}")
+                            continue
+                    engineer = RiskFeatureEngineer(
+                        portfolio_returns=daily_returns.iloc[starts[i]:starts[i] + self.WINDOW_LENGTH],
+                        component_returns=window_component_returns,
+                        weights=weights,
+                        precomputed_cov=window_cov
+                    )
+                    div_ratio[i] = engineer.compute_diversification_ratio()
+
+            labels = self._assign_risk_labels(vol, var95, max_dd)
+
+            frames.append(pd.DataFrame({
+                "Portfolio_ID": portfolio_id,
+                "Window_Start": window_starts,
+                "Window_End": window_ends,
+                "Vol": vol,
+                "VaR95": var95,
+                "MaxDD": max_dd,
+                "DivRatio": div_ratio,
+                "Label": labels
+            }))
+
+        if not frames:
+            return pd.DataFrame()
+
+        panel_df = pd.concat(frames, ignore_index=True)
         return panel_df
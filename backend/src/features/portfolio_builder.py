@@ -1,7 +1,7 @@
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -23,38 +23,60 @@ class PortfolioBuilder:
             raise ValueError("Provided price_data is empty.")
             
         self.price_data = price_data
-        # Calculate daily returns
-        self.daily_returns = self.price_data.pct_change().dropna()
+        # Calculate daily returns in one NumPy pass instead of pct_change().dropna(),
+        # which allocates a full NaN row and a filtered copy
+        prices = np.ascontiguousarray(self.price_data.to_numpy(dtype=np.float64))
+        self._returns_matrix = prices[1:] / prices[:-1] - 1.0
+        self.daily_returns = pd.DataFrame(
+            self._returns_matrix,
+            index=self.price_data.index[1:],
+            columns=self.price_data.columns
+        )
         self.available_tickers = list(self.daily_returns.columns)
+        self._ticker_idx = {ticker: i for i, ticker in enumerate(self.available_tickers)}
+        self._ticker_set = frozenset(self.available_tickers)
         logger.info(f"Initialized PortfolioBuilder with {len(self.available_tickers)} tickers.")
 
-    def build_portfolio(self, weights: Dict[str, float]) -> pd.DataFrame:
+    def build_portfolio(self, weights: Union[Dict[str, float], np.ndarray]) -> pd.DataFrame:
         """
         Calculates the portfolio's aggregated daily and cumulative returns for a given configuration of weights.
-        
+
         Args:
-            weights (Dict[str, float]): Dictionary mapping tickers to their target weights (summing to ~1.0).
-                                        Example: {"SETFNIF50.NS": 0.6, "ITBEES.NS": 0.4}
-                                        
+            weights: Dictionary mapping tickers to their target weights (summing to ~1.0),
+                     e.g. {"SETFNIF50.NS": 0.6, "ITBEES.NS": 0.4}, or a weight vector
+                     already aligned to `available_tickers`.
+
         Returns:
             pd.DataFrame: DataFrame containing 'Daily_Return' and 'Cumulative_Return'
         """
-        self._validate_weights(weights)
-        
-        # Align weights with the DataFrame columns
-        aligned_weights = np.array([weights.get(ticker, 0.0) for ticker in self.available_tickers])
-        
-        # Calculate portfolio daily returns: sum(weight_i * return_i) for each day
-        portfolio_daily_returns = self.daily_returns.dot(aligned_weights)
-        
+        if isinstance(weights, dict):
+            self._validate_weights(weights)
+
+            # Align weights with the cached return matrix columns
+            aligned_weights = np.zeros(len(self.available_tickers), dtype=np.float64)
+            for ticker, weight in weights.items():
+                aligned_weights[self._ticker_idx[ticker]] = weight
+        else:
+            # Weight vector already aligned to available_tickers: no dict rebuild
+            aligned_weights = np.ascontiguousarray(weights, dtype=np.float64)
+            if aligned_weights.shape != (len(self.available_tickers),):
+                raise ValueError(f"Weight vector must have length {len(self.available_tickers)}. Got shape {aligned_weights.shape}.")
+            total_weight = float(aligned_weights.sum())
+            if abs(total_weight - 1.0) > 1e-5:
+                raise ValueError(f"Portfolio weights must sum to 1.0. Current sum: {total_weight}")
+
+        # Portfolio daily returns as a single BLAS matvec on the contiguous matrix
+        portfolio_daily_returns = self._returns_matrix @ aligned_weights
+
         # Calculate cumulative returns
-        portfolio_cumulative_returns = (1 + portfolio_daily_returns).cumprod() - 1
-        
+        portfolio_cumulative_returns = np.cumprod(1.0 + portfolio_daily_returns) - 1.0
+
+        # Only wrap in pandas at the return boundary
         result = pd.DataFrame({
             'Daily_Return': portfolio_daily_returns,
             'Cumulative_Return': portfolio_cumulative_returns
-        })
-        
+        }, index=self.daily_returns.index)
+
         return result
 
     def _validate_weights(self, weights: Dict[str, float]):
@@ -63,11 +85,12 @@ class PortfolioBuilder:
         """
         if not weights:
             raise ValueError("Weights dictionary cannot be empty.")
-            
+
+        # frozenset membership + plain scalar arithmetic keep per-request validation cheap
         for ticker in weights.keys():
-            if ticker not in self.available_tickers:
+            if ticker not in self._ticker_set:
                 raise ValueError(f"Ticker '{ticker}' not found in available price data.")
-                
+
         total_weight = sum(weights.values())
-        if not np.isclose(total_weight, 1.0, rtol=1e-5):
+        if abs(total_weight - 1.0) > 1e-5:
             raise ValueError(f"Portfolio weights must sum to 1.0. Current sum: {total_weight}")
@@ -1,10 +1,24 @@
+import hashlib
 import pandas as pd
 import numpy as np
 import logging
+import threading
+from collections import OrderedDict
+from functools import cached_property
 from typing import Dict
+from src.features._numba_kernels import max_drawdown, max_drawdown_gu, return_stats
 
 logger = logging.getLogger(__name__)
 
+# LRU of compute_all_features results keyed by input content, shared across
+# engineer instances: repeat API submissions with the same window and weights
+# hit the cache instead of re-running the kernels
+_FEATURE_CACHE: "OrderedDict[tuple, Dict[str, float]]" = OrderedDict()
+_FEATURE_CACHE_MAXSIZE = 256
+# Engineers run on FastAPI's threadpool, so lookup/insert/eviction on the
+# shared OrderedDict must not interleave
+_FEATURE_CACHE_LOCK = threading.Lock()
+
 class RiskFeatureEngineer:
     """
     Computes specific Risk Metrics from daily portfolio returns.
@@ -16,52 +30,95 @@ class RiskFeatureEngineer:
     """
     
     TRADING_DAYS_PER_YEAR = 252
+    _SQRT_TRADING_DAYS_PER_YEAR = TRADING_DAYS_PER_YEAR ** 0.5
 
-    def __init__(self, portfolio_returns: pd.Series, component_returns: pd.DataFrame = None, weights: Dict[str, float] = None):
+    def __init__(self, portfolio_returns: pd.Series, component_returns: pd.DataFrame = None, weights: Dict[str, float] = None, precomputed_cov: np.ndarray = None):
         """
         Initializes the engineer.
-        
+
         Args:
             portfolio_returns (pd.Series): The daily returns of the portfolio.
             component_returns (pd.DataFrame): Daily returns of the individual assets (needed for Diversification Ratio).
             weights (Dict[str, float]): The normalized weights of the assets in the portfolio (needed for Diversification Ratio).
+            precomputed_cov (np.ndarray): Optional component covariance matrix (ddof=1) aligned
+                                          to component_returns columns. When provided, the
+                                          Diversification Ratio skips recomputing component
+                                          volatilities from scratch.
         """
         if portfolio_returns.empty:
             raise ValueError("Provided portfolio_returns is empty.")
-            
+
         self.portfolio_returns = portfolio_returns
         self.component_returns = component_returns
         self.weights = weights
+        self.precomputed_cov = precomputed_cov
+        # Contiguous float64 view of the returns; every metric below operates on
+        # this ndarray instead of re-entering pandas per call
+        self._ret = np.ascontiguousarray(portfolio_returns.to_numpy(dtype=np.float64))
+        # Component matrix as one contiguous buffer, and a weight vector aligned
+        # to its columns so the weighted average of component vols is a single
+        # dot product
+        self._comp = np.ascontiguousarray(component_returns.to_numpy(dtype=np.float64)) if component_returns is not None else None
+        if component_returns is not None and weights is not None:
+            self._w = np.array([weights.get(c, 0.0) for c in component_returns.columns], dtype=np.float64)
+        else:
+            self._w = None
+        # Content hash computed once here so the compute_all_features cache
+        # lookup is a single dict probe. The component matrix and its column
+        # order are part of the key: identical portfolio returns with
+        # different components must not share a Diversification Ratio.
+        self._cache_key = (
+            hashlib.blake2b(self._ret.tobytes()).digest(),
+            tuple(sorted(weights.items())) if weights is not None else None,
+            (hashlib.blake2b(self._comp.tobytes()).digest(), tuple(component_returns.columns))
+            if self._comp is not None else None,
+        )
         
+    @cached_property
+    def _daily_vol(self) -> float:
+        """Daily portfolio volatility (ddof=1), computed once and shared between metrics."""
+        return float(np.std(self._ret, ddof=1))
+
     def compute_annualized_volatility(self) -> float:
         """
         Calculates the annualized volatility of the portfolio based on daily returns.
         """
-        daily_vol = self.portfolio_returns.std()
-        annualized_vol = daily_vol * np.sqrt(self.TRADING_DAYS_PER_YEAR)
+        annualized_vol = self._daily_vol * self._SQRT_TRADING_DAYS_PER_YEAR
         return float(annualized_vol)
 
     def compute_historical_var_95(self) -> float:
         """
         Calculates the Historical Value at Risk (VaR) at 95% confidence.
         Represents the minimum expected loss over the next day in the worst 5% of cases.
-        Output is expressed as a positive number (a loss amount).
+        Output is expressed as a positive number (a loss amount), clamped at zero
+        for all-gain histories.
         """
-        # 5th percentile of returns represents the threshold for the worst 5% of days
-        var_95 = np.percentile(self.portfolio_returns, 5)
-        # Returns generally are negative for losses, VaR is typically expressed as a positive maximum loss
-        return float(abs(var_95))
+        # Empirical quantile as the ceil(0.05*n)-th order statistic; np.partition
+        # places it in O(n) without sorting the whole array
+        n = self._ret.size
+        k = max(int(np.ceil(0.05 * n)) - 1, 0)
+        var_95 = -np.partition(self._ret, k)[k]
+        # Negating the loss threshold gives a positive loss amount; a positive
+        # 5th percentile (no losses in the window) means zero VaR, not a "loss"
+        return float(max(0.0, var_95))
 
     def compute_max_drawdown(self) -> float:
         """
         Calculates the Maximum Drawdown.
         Represents the maximum observed loss linearly from a historical peak.
         """
-        cumulative_returns = (1 + self.portfolio_returns).cumprod()
-        rolling_max = cumulative_returns.cummax()
-        drawdown = (cumulative_returns - rolling_max) / rolling_max
-        max_drawdown = drawdown.min()
-        return float(abs(max_drawdown))
+        # Fused single-pass numba kernel: no intermediate cumprod/cummax arrays
+        return float(max_drawdown(self._ret))
+
+    def compute_component_drawdowns(self) -> np.ndarray:
+        """
+        Max drawdown of every individual component, aligned to the
+        component_returns columns. One broadcast over the shared gufunc
+        kernel instead of a Python loop per asset.
+        """
+        if self.component_returns is None:
+            raise ValueError("component_returns is required for per-asset drawdowns.")
+        return max_drawdown_gu(self._comp.T)
 
     def compute_diversification_ratio(self) -> float:
         """
@@ -73,17 +130,19 @@ class RiskFeatureEngineer:
             logger.warning("Component returns or weights not provided. Cannot compute Diversification Ratio.")
             return np.nan
             
-        # 1. Compute individual daily volatilities
-        individual_vols = self.component_returns.std()
-        
-        # 2. Compute the weighted average of individual volatilities
-        weighted_avg_vol = 0.0
-        for ticker, weight in self.weights.items():
-            if ticker in individual_vols:
-               weighted_avg_vol += weight * individual_vols[ticker]
-               
-        # 3. Get portfolio volatility (daily)
-        portfolio_vol = self.portfolio_returns.std()
+        # 1. Compute individual daily volatilities (from the precomputed covariance when available)
+        if self.precomputed_cov is not None:
+            individual_vols = np.sqrt(np.diag(self.precomputed_cov))
+        else:
+            # Single C loop over columns (ddof=1 matches the old pandas default)
+            # instead of per-column Series construction
+            individual_vols = np.std(self._comp, axis=0, ddof=1)
+
+        # 2. Weighted average of individual volatilities as a single dot product
+        weighted_avg_vol = float(self._w @ individual_vols)
+
+        # 3. Get portfolio volatility (daily, cached from the annualized-vol computation)
+        portfolio_vol = self._daily_vol
         
         if np.isclose(portfolio_vol, 0.0):
             return 1.0 # If risk is 0, return 1 to avoid ZeroDivisionError
@@ -94,15 +153,35 @@ class RiskFeatureEngineer:
     def compute_all_features(self) -> Dict[str, float]:
         """
         Computes all 4 allowed risk features and returns them as a dictionary.
+        Volatility and max drawdown come from one fused pass over the returns;
+        VaR needs a partial sort and stays separate. Results are memoized per
+        (returns content, weights) so repeat submissions of the same window
+        skip the computation entirely.
         """
+        with _FEATURE_CACHE_LOCK:
+            cached = _FEATURE_CACHE.get(self._cache_key)
+            if cached is not None:
+                _FEATURE_CACHE.move_to_end(self._cache_key)
+                return dict(cached)
+
+        daily_vol, max_dd = return_stats(self._ret)
+        # Seed the cached daily vol so the Diversification Ratio reuses the fused result
+        self.__dict__['_daily_vol'] = daily_vol
+
+        # All 4 keys are always present (NaN when components are unavailable),
+        # so consumers get a fixed-shape dict built in one literal
+        has_components = self.component_returns is not None and self.weights is not None
+        # No float(...) wrappers needed: numba already marshals the kernel's
+        # UniTuple as Python floats at the boundary
         features = {
-            "Annualized_Volatility": self.compute_annualized_volatility(),
+            "Annualized_Volatility": daily_vol * self._SQRT_TRADING_DAYS_PER_YEAR,
             "Historical_VaR_95": self.compute_historical_var_95(),
-            "Maximum_Drawdown": self.compute_max_drawdown()
+            "Maximum_Drawdown": max_dd,
+            "Diversification_Ratio": self.compute_diversification_ratio() if has_components else np.nan
         }
-        
-        # Only add Diversification Ratio if dependencies are met
-        if self.component_returns is not None and self.weights is not None:
-             features["Diversification_Ratio"] = self.compute_diversification_ratio()
-             
+
+        with _FEATURE_CACHE_LOCK:
+            _FEATURE_CACHE[self._cache_key] = dict(features)
+            if len(_FEATURE_CACHE) > _FEATURE_CACHE_MAXSIZE:
+                _FEATURE_CACHE.popitem(last=False)
         return features
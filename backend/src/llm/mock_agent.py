@@ -0,0 +1,39 @@
+import logging
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+class MockLLMAgent:
+    """
+    Stand-in for an LLM-backed explanation service. Turns the predicted risk
+    class and the 4 computed risk metrics into a plain-language summary.
+    """
+
+    # Built (and interned) once at class definition instead of re-assembling
+    # an f-string per request
+    _TMPL = (
+        "Based on its past performance, this portfolio is currently considered {cls} risk. "
+        "On average, its value goes up or down by about {vol:.2%} each year. "
+        "On a bad day (worst 5% of days), it could lose around {var95:.2%} of its value. "
+        "Its largest historical peak-to-trough decline was {max_dd:.2%}. "
+        "Its diversification ratio of {div_ratio:.2f} indicates how much the mix of holdings spreads out the risk."
+    )
+
+    def generate_explanation(self, risk_class: str, features: Dict[str, float]) -> str:
+        """
+        Builds a short natural-language explanation of the risk assessment.
+
+        Args:
+            risk_class (str): Predicted risk class ("Low", "Medium" or "High").
+            features (Dict[str, float]): The computed risk metrics.
+
+        Returns:
+            str: Human-readable explanation.
+        """
+        return self._TMPL.format_map({
+            "cls": risk_class,
+            "vol": features.get("Annualized_Volatility", 0.0),
+            "var95": features.get("Historical_VaR_95", 0.0),
+            "max_dd": features.get("Maximum_Drawdown", 0.0),
+            "div_ratio": features.get("Diversification_Ratio", 1.0),
+        })
@@ -0,0 +1,99 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.features.dataset_builder import DatasetBuilder
+from src.features.risk_metrics import RiskFeatureEngineer
+
+@pytest.fixture
+def mock_portfolio_returns():
+    """Mock daily portfolio returns long enough for several rolling windows."""
+    rng = np.random.default_rng(42)
+    n_days = 200
+    dates = pd.bdate_range(start="2022-01-03", periods=n_days)
+    returns = pd.Series(rng.normal(0.0005, 0.01, n_days), index=dates)
+    return pd.DataFrame({"Daily_Return": returns})
+
+def test_builder_empty_portfolios():
+    with pytest.raises(ValueError, match="empty"):
+        DatasetBuilder({})
+
+def test_build_panel_dataset_columns(mock_portfolio_returns):
+    builder = DatasetBuilder({"P1": mock_portfolio_returns})
+    panel = builder.build_panel_dataset()
+
+    expected_columns = [
+        "Portfolio_ID", "Window_Start", "Window_End",
+        "Vol", "VaR95", "MaxDD", "DivRatio", "Label"
+    ]
+    assert list(panel.columns) == expected_columns
+
+    # 200 days, window 126, step 21 -> windows starting at 0, 21, 42, 63
+    assert len(panel) == 4
+    assert set(panel["Label"]).issubset({"Low", "Medium", "High"})
+
+def test_build_panel_dataset_skips_short_history(mock_portfolio_returns):
+    short = mock_portfolio_returns.iloc[:50]
+    builder = DatasetBuilder({"LONG": mock_portfolio_returns, "SHORT": short})
+    panel = builder.build_panel_dataset()
+
+    assert set(panel["Portfolio_ID"]) == {"LONG"}
+
+def test_window_metrics_match_engineer(mock_portfolio_returns):
+    """The vectorized window metrics must match a per-window RiskFeatureEngineer."""
+    builder = DatasetBuilder({"P1": mock_portfolio_returns})
+    panel = builder.build_panel_dataset()
+
+    daily_returns = mock_portfolio_returns["Daily_Return"]
+    for i in range(len(panel)):
+        start = i * DatasetBuilder.STEP_SIZE
+        window = daily_returns.iloc[start:start + DatasetBuilder.WINDOW_LENGTH]
+        engineer = RiskFeatureEngineer(window)
+
+        assert np.isclose(panel["Vol"].iloc[i], engineer.compute_annualized_volatility())
+        assert np.isclose(panel["VaR95"].iloc[i], engineer.compute_historical_var_95())
+        assert np.isclose(panel["MaxDD"].iloc[i], engineer.compute_max_drawdown())
+        assert panel["Window_Start"].iloc[i] == window.index[0]
+        assert panel["Window_End"].iloc[i] == window.index[-1]
+
+def test_div_ratio_rolling_cov_matches_engineer():
+    """The rolled-forward covariance must reproduce the per-window DivRatio."""
+    rng = np.random.default_rng(7)
+    n_days = 200
+    dates = pd.bdate_range(start="2022-01-03", periods=n_days)
+    component_returns = pd.DataFrame(
+        rng.normal(0.0005, 0.012, (n_days, 3)),
+        index=dates,
+        columns=["ETF1", "ETF2", "ETF3"]
+    )
+    weights = {"ETF1": 0.5, "ETF2": 0.3, "ETF3": 0.2}
+    portfolio_returns = component_returns.dot(pd.Series(weights))
+    portfolio_df = pd.DataFrame({"Daily_Return": portfolio_returns})
+
+    builder = DatasetBuilder(
+        {"P1": portfolio_df},
+        component_returns_dict={"P1": component_returns},
+        weights_dict={"P1": weights}
+    )
+    panel = builder.build_panel_dataset()
+
+    for i in range(len(panel)):
+        start = i * DatasetBuilder.STEP_SIZE
+        end = start + DatasetBuilder.WINDOW_LENGTH
+        engineer = RiskFeatureEngineer(
+            portfolio_returns.iloc[start:end],
+            component_returns.iloc[start:end],
+            weights
+        )
+        assert np.isclose(panel["DivRatio"].iloc[i], engineer.compute_diversification_ratio())
+
+def test_assign_risk_labels_vectorized_matches_scalar(mock_portfolio_returns):
+    builder = DatasetBuilder({"P1": mock_portfolio_returns})
+
+    vol = np.array([0.05, 0.15, 0.30])
+    var95 = np.array([0.005, 0.01, 0.05])
+    max_dd = np.array([0.05, 0.18, 0.40])
+
+    vectorized = builder._assign_risk_labels(vol, var95, max_dd)
+    scalar = [builder._assign_risk_label(v, q, m) for v, q, m in zip(vol, var95, max_dd)]
+
+    assert list(vectorized) == scalar
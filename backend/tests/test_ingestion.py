@@ -81,6 +81,101 @@ def test_successful_data_fetch(mock_download, valid_holdings_input, mock_yf_down
     assert len(price_df) == 5
     assert price_df.iloc[0]["TCS.NS"] == 100
 
+@pytest.fixture
+def mock_yf_download_recent():
+    """Like mock_yf_download_success but spanning the default 5y fetch window."""
+    dates = pd.date_range(end=pd.Timestamp.today().normalize(), periods=5 * 366, freq="D")
+    columns = pd.MultiIndex.from_tuples([
+        ('Adj Close', 'TCS.NS'),
+        ('Adj Close', 'INFY.NS')
+    ])
+    values = np.column_stack([
+        np.linspace(100.0, 200.0, len(dates)),
+        np.linspace(50.0, 100.0, len(dates))
+    ])
+    return pd.DataFrame(values, index=dates, columns=columns)
+
+@patch('yfinance.download')
+def test_price_cache_skips_redownload(mock_download, valid_holdings_input, mock_yf_download_recent, tmp_path):
+    mock_download.return_value = mock_yf_download_recent
+
+    fetcher = ETFDataFetcher(cache_dir=str(tmp_path))
+    first = fetcher.fetch_data(valid_holdings_input)
+    assert mock_download.call_count == 2  # one download per ticker
+
+    # Second fetch should be served entirely from the parquet cache
+    second = fetcher.fetch_data(valid_holdings_input)
+    assert mock_download.call_count == 2
+    assert list(second["price_data"].columns) == ["TCS.NS", "INFY.NS"]
+    # The cached read clips to the requested window; values must match the download
+    pd.testing.assert_frame_equal(
+        first["price_data"].loc[second["price_data"].index],
+        second["price_data"]
+    )
+
+@patch('yfinance.download')
+def test_price_cache_downloads_only_missing_tickers(mock_download, mock_yf_download_recent, tmp_path):
+    mock_download.return_value = mock_yf_download_recent
+
+    fetcher = ETFDataFetcher(cache_dir=str(tmp_path))
+    fetcher.fetch_data({
+        "etf_name": "T",
+        "holdings": [
+            {"ticker": "TCS.NS", "weight": 0.6},
+            {"ticker": "INFY.NS", "weight": 0.4}
+        ]
+    })
+
+    # Add a new ticker: only the uncached one should be requested
+    dates = pd.date_range(end=pd.Timestamp.today().normalize(), periods=5 * 366, freq="D")
+    mock_download.return_value = pd.DataFrame(
+        {'Adj Close': np.linspace(10.0, 20.0, len(dates))}, index=dates
+    )
+    fetcher.fetch_data({
+        "etf_name": "T",
+        "holdings": [
+            {"ticker": "TCS.NS", "weight": 0.5},
+            {"ticker": "HCLTECH.NS", "weight": 0.5}
+        ]
+    })
+
+    assert mock_download.call_count == 3
+    assert mock_download.call_args[0][0] == "HCLTECH.NS"
+
+@patch('yfinance.download')
+def test_parallel_array_holdings_input(mock_download, mock_yf_download_success):
+    mock_download.return_value = mock_yf_download_success
+
+    fetcher = ETFDataFetcher()
+    result = fetcher.fetch_data({
+        "etf_name": "TEST_ETF",
+        "tickers": ["TCS.NS", "INFY.NS"],
+        "weights": [0.6, 0.4]
+    })
+
+    assert result["weights"] == {"TCS.NS": 0.6, "INFY.NS": 0.4}
+    assert result["tickers"] == ["TCS.NS", "INFY.NS"]
+    np.testing.assert_array_equal(result["weight_array"], np.array([0.6, 0.4]))
+
+@patch('yfinance.download')
+def test_lookback_days_overrides_years(mock_download, valid_holdings_input, mock_yf_download_success):
+    mock_download.return_value = mock_yf_download_success
+
+    fetcher = ETFDataFetcher(years=5, lookback_days=180)
+    fetcher.fetch_data(valid_holdings_input)
+
+    requested_start = mock_download.call_args[1]["start"]
+    assert (pd.Timestamp.today() - pd.Timestamp(requested_start)).days <= 181
+
+def test_parallel_array_holdings_length_mismatch():
+    fetcher = ETFDataFetcher()
+    with pytest.raises(ValueError, match="same length"):
+        fetcher.fetch_data({
+            "etf_name": "TEST_ETF",
+            "tickers": ["TCS.NS", "INFY.NS"],
+            "weights": [1.0]
+        })
+
 @patch('yfinance.download')
 def test_missing_ticker_in_response(mock_download, valid_holdings_input):
     # Mock yfinance only returning data for TCS, skipping INFY
@@ -88,9 +183,12 @@ def test_missing_ticker_in_response(mock_download, valid_holdings_input):
     df = pd.DataFrame({'Adj Close': [100, 101, 102, 103, 104]}, index=dates)
     # yfinance usually returns a normal df for a single valid ticker
     df.columns.name = 'Ticker'
-    
-    mock_download.return_value = df
-    
+
+    def fake_download(ticker, *args, **kwargs):
+        return df if ticker == "TCS.NS" else pd.DataFrame()
+
+    mock_download.side_effect = fake_download
+
     fetcher = ETFDataFetcher()
     with pytest.raises(ValueError, match="Failed to fetch data for these expected tickers"):
          fetcher.fetch_data(valid_holdings_input)
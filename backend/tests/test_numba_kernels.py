@@ -0,0 +1,41 @@
+import numpy as np
+from src.features import _numba_kernels as kernels
+
+def test_kernels_precompiled_at_import():
+    """Eager signatures must keep compilation at import time, not first call."""
+    for kernel in (kernels.compute_window_stats, kernels.compute_window_stats_len126,
+                   kernels.max_drawdown, kernels.return_stats):
+        assert len(kernel.nopython_signatures) > 0
+
+def test_max_drawdown_matches_numpy_reference():
+    rng = np.random.default_rng(42)
+    returns = rng.normal(0.0005, 0.01, 252)
+
+    cumulative = np.cumprod(1.0 + returns)
+    peaks = np.maximum.accumulate(cumulative)
+    expected = ((peaks - cumulative) / peaks).max()
+
+    assert np.isclose(kernels.max_drawdown(returns), expected)
+
+def test_max_drawdown_gu_matches_scalar_kernel_per_column():
+    rng = np.random.default_rng(3)
+    returns = rng.normal(0.0, 0.015, (200, 4))
+
+    per_asset = kernels.max_drawdown_gu(returns.T)
+
+    assert per_asset.shape == (4,)
+    for j in range(4):
+        column = np.ascontiguousarray(returns[:, j])
+        assert np.isclose(per_asset[j], kernels.max_drawdown(column))
+
+def test_return_stats_matches_numpy_reference():
+    rng = np.random.default_rng(7)
+    returns = rng.normal(0.0, 0.02, 126)
+
+    std, mdd = kernels.return_stats(returns)
+
+    assert np.isclose(std, np.std(returns, ddof=1))
+    assert np.isclose(mdd, kernels.max_drawdown(returns))
+
+def test_warm_up_runs():
+    kernels.warm_up()
@@ -44,6 +44,20 @@ def test_build_portfolio_valid_weights(mock_price_data):
     # Portfolio return = 0.5 * 0.02 + 0.5 * 0.02 = 0.02
     assert np.isclose(result['Daily_Return'].iloc[0], 0.02)
 
+def test_build_portfolio_weight_vector(mock_price_data):
+    builder = PortfolioBuilder(mock_price_data)
+
+    from_dict = builder.build_portfolio({'ETF1': 0.5, 'ETF2': 0.5})
+    from_array = builder.build_portfolio(np.array([0.5, 0.5, 0.0]))
+
+    pd.testing.assert_frame_equal(from_dict, from_array)
+
+def test_build_portfolio_weight_vector_wrong_length(mock_price_data):
+    builder = PortfolioBuilder(mock_price_data)
+
+    with pytest.raises(ValueError, match="length 3"):
+        builder.build_portfolio(np.array([0.5, 0.5]))
+
 def test_build_portfolio_invalid_weights_sum(mock_price_data):
     builder = PortfolioBuilder(mock_price_data)
     
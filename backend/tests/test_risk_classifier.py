@@ -0,0 +1,81 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.models.risk_classifier import RiskClassifier
+
+@pytest.fixture
+def mock_panel_dataset():
+    """Synthetic panel dataset with clearly separable risk classes."""
+    rng = np.random.default_rng(42)
+    n_rows = 120
+    vol = rng.uniform(0.05, 0.35, n_rows)
+    var95 = vol / 16
+    max_dd = vol * 1.2
+    labels = np.where(vol < 0.12, "Low", np.where(vol > 0.20, "High", "Medium"))
+
+    return pd.DataFrame({
+        "Window_End": pd.bdate_range(start="2021-01-04", periods=n_rows),
+        "Vol": vol,
+        "VaR95": var95,
+        "MaxDD": max_dd,
+        "DivRatio": rng.uniform(1.0, 1.5, n_rows),
+        "Label": labels
+    })
+
+def test_predict_requires_training():
+    classifier = RiskClassifier()
+    with pytest.raises(RuntimeError, match="trained"):
+        classifier.predict(np.zeros((1, 4)))
+
+def test_train_and_evaluate(mock_panel_dataset):
+    classifier = RiskClassifier()
+    results = classifier.train_and_evaluate(mock_panel_dataset, n_splits=3)
+
+    assert classifier.is_trained
+    assert results["final_model_trained"]
+    assert len(results["fold_accuracies"]) == 3
+    assert 0.0 <= results["average_accuracy"] <= 1.0
+
+def test_predict_dataframe_and_ndarray_agree(mock_panel_dataset):
+    classifier = RiskClassifier()
+    classifier.train_and_evaluate(mock_panel_dataset, n_splits=3)
+
+    features_df = mock_panel_dataset[RiskClassifier.FEATURES].iloc[:5]
+    from_df = classifier.predict(features_df)
+    from_array = classifier.predict(features_df.to_numpy())
+
+    np.testing.assert_array_equal(from_df, from_array)
+    assert set(from_df).issubset({"Low", "Medium", "High"})
+
+def test_predict_single_row_vector(mock_panel_dataset):
+    classifier = RiskClassifier()
+    classifier.train_and_evaluate(mock_panel_dataset, n_splits=3)
+
+    prediction = classifier.predict(np.array([0.08, 0.005, 0.05, 1.2]))
+    assert prediction.shape == (1,)
+
+def test_predict_batch_matches_per_row_predict(mock_panel_dataset):
+    classifier = RiskClassifier()
+    classifier.train_and_evaluate(mock_panel_dataset, n_splits=3)
+
+    rows = mock_panel_dataset[RiskClassifier.FEATURES].iloc[:4]
+    feature_dicts = rows.to_dict(orient="records")
+
+    batched = classifier.predict_batch(feature_dicts)
+    per_row = np.concatenate([classifier.predict(rows.iloc[[i]]) for i in range(len(rows))])
+
+    np.testing.assert_array_equal(batched, per_row)
+
+def test_predict_batch_rejects_missing_features(mock_panel_dataset):
+    classifier = RiskClassifier()
+    classifier.train_and_evaluate(mock_panel_dataset, n_splits=3)
+
+    with pytest.raises(ValueError, match="missing required features"):
+        classifier.predict_batch([{"Vol": 0.1, "VaR95": 0.01}])
+
+def test_predict_rejects_wrong_feature_count(mock_panel_dataset):
+    classifier = RiskClassifier()
+    classifier.train_and_evaluate(mock_panel_dataset, n_splits=3)
+
+    with pytest.raises(ValueError, match="feature columns"):
+        classifier.predict(np.zeros((2, 3)))
@@ -36,10 +36,15 @@ def test_compute_annualized_volatility(mock_returns):
 
 def test_compute_historical_var_95(mock_returns):
     engineer = RiskFeatureEngineer(mock_returns)
-    # The 5th percentile of [0.01, -0.02, 0.03, -0.01, 0.005] is approx -0.018
-    # VaR should be returned as a positive number
-    expected_var = float(abs(np.percentile(mock_returns, 5)))
-    assert np.isclose(engineer.compute_historical_var_95(), expected_var)
+    # VaR is the ceil(0.05*n)-th worst return expressed as a positive loss;
+    # for n=5 that is the single worst day, -0.02
+    assert np.isclose(engineer.compute_historical_var_95(), 0.02)
+
+def test_compute_historical_var_95_all_gains():
+    # A window with no losing days should report zero VaR, not a phantom loss
+    returns = pd.Series([0.01, 0.02, 0.015, 0.03, 0.005])
+    engineer = RiskFeatureEngineer(returns)
+    assert engineer.compute_historical_var_95() == 0.0
 
 def test_compute_max_drawdown():
     # Construct a specific series for max drawdown
@@ -112,3 +117,37 @@ def test_compute_all_features(mock_returns, mock_component_data):
     assert set(features.keys()) == expected_keys
     for k, v in features.items():
         assert isinstance(v, float)
+
+def test_compute_all_features_without_components(mock_returns):
+    # The dict shape is fixed: DivRatio is NaN when components are unavailable
+    engineer = RiskFeatureEngineer(mock_returns)
+
+    features = engineer.compute_all_features()
+
+    assert set(features.keys()) == {
+        "Annualized_Volatility",
+        "Historical_VaR_95",
+        "Maximum_Drawdown",
+        "Diversification_Ratio"
+    }
+    assert np.isnan(features["Diversification_Ratio"])
+
+def test_compute_all_features_memoized(mock_returns, mock_component_data):
+    comp_returns, weights = mock_component_data
+
+    first = RiskFeatureEngineer(mock_returns, comp_returns, weights).compute_all_features()
+    # Mutating the returned dict must not poison the shared cache
+    first["Annualized_Volatility"] = -1.0
+
+    second = RiskFeatureEngineer(mock_returns.copy(), comp_returns, dict(weights)).compute_all_features()
+    assert second["Annualized_Volatility"] != -1.0
+    assert second["Historical_VaR_95"] == first["Historical_VaR_95"]
+
+    # Different weights must miss the cache and change the DivRatio
+    other_weights = {'ETF1': 0.8, 'ETF2': 0.2}
+    other = RiskFeatureEngineer(mock_returns, comp_returns, other_weights).compute_all_features()
+    assert other["Diversification_Ratio"] != second["Diversification_Ratio"]
+
+    # Same returns and weights but different component data must also miss
+    scaled = RiskFeatureEngineer(mock_returns, comp_returns * 2, weights).compute_all_features()
+    assert scaled["Diversification_Ratio"] != second["Diversification_Ratio"]
@@ -11,11 +11,18 @@ candidates = {
     "CPSE / PSU ETF": ["CPSEETF.NS", "PSUBNKBEES.NS"]
 }
 
+# One batched request for every candidate at once (yfinance threads the
+# per-ticker fetches internally) instead of a serial network roundtrip per
+# ticker; the loop below only inspects the already-downloaded frame.
+all_tickers = [t for tickers in candidates.values() for t in tickers]
+data = yf.download(" ".join(all_tickers), period="5y", progress=False,
+                   threads=True, group_by="ticker")
+
 for name, tickers in candidates.items():
     print(f"\nTesting {name}:")
     for t in tickers:
         try:
-            d = yf.download(t, period="5y", progress=False)
+            d = data[t].dropna(how="all")
             if not d.empty and len(d) > 1000:
                 print(f"  [SUCCESS] {t} ({len(d)} days)")
             else: